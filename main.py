@@ -1,8 +1,20 @@
+import hashlib
+from pathlib import Path
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+try:
+    # Arrow CSV engine and Parquet cache
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # ----------------------------------------------------
 # 1. Set Page Configuration (Must Be First Streamlit Command)
 # ----------------------------------------------------
@@ -13,19 +25,6 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# ----------------------------------------------------
-# 2. Load and Clean the Dataset
-# ----------------------------------------------------
-@st.cache_data
-def load_data(file_path: str) -> pd.DataFrame:
-    """
-    Loads the telco dataset from a CSV file and fills specified columns' NaN with 'Unknown'.
-    """
-    df_ = pd.read_csv(file_path)
-    cols_to_change = ['Churn Reason', 'Churn Category', 'Internet Type', 'Offer']
-    df_[cols_to_change] = df_[cols_to_change].fillna('Unknown')
-    return df_
-
 # ----------------------------------------------------
 # Tenure Bin Definitions
 # ----------------------------------------------------
@@ -40,38 +39,439 @@ TENURE_LABELS = [
     "61+ months"
 ]
 
-def preprocess_data(df):
-    df["Tenure Group"] = pd.cut(
-        df["Tenure in Months"],
+# ----------------------------------------------------
+# Age Bin Definitions (left-closed: [0, 30), [30, 50), [50, inf))
+# ----------------------------------------------------
+AGE_BINS = [0, 30, 50, float('inf')]
+AGE_LABELS = ['(Under 30 years)', '(30-50 years)', '(Over 50 years)']
+# Shorter names for the same bins, used by the competition analysis
+AGE_COMPETITION_LABELS = ["Under 30", "30-50", "50+"]
+
+# ----------------------------------------------------
+# 2. Load and Clean the Dataset
+# ----------------------------------------------------
+SERVICE_COLUMNS = [
+    "Phone Service", "Internet Service", "Multiple Lines",
+    "Streaming TV", "Streaming Movies", "Streaming Music",
+    "Online Security", "Online Backup", "Device Protection Plan",
+    "Premium Tech Support", "Unlimited Data"
+]
+
+# Low-cardinality text columns stored as 'category' so filters compare integer codes
+CATEGORICAL_COLUMNS = [
+    *SERVICE_COLUMNS,
+    "Gender", "Churn Label", "Contract",
+    "Churn Reason", "Churn Category", "Internet Type", "Offer"
+]
+
+DATA_PATH = 'telco.csv'
+
+# Only the columns the report reads are parsed; everything else in the CSV is skipped
+USED_COLUMNS = [
+    "Customer ID", "Gender", "Age", "Latitude", "Longitude", "Tenure in Months",
+    *SERVICE_COLUMNS, "Internet Type", "Offer", "Contract",
+    "Churn Label", "CLTV", "Churn Category", "Churn Reason"
+]
+
+COLUMN_DTYPES = {
+    **{col: 'category' for col in CATEGORICAL_COLUMNS},
+    "Latitude": 'float32',
+    "Longitude": 'float32',
+    "Age": 'int16',
+    "Tenure in Months": 'int16',
+    "CLTV": 'int32'
+}
+
+# Fingerprint of the load schema, part of every data key (see data_signature)
+SCHEMA_KEY = hashlib.sha1(repr((USED_COLUMNS, COLUMN_DTYPES)).encode()).hexdigest()[:12]
+# Parquet schema-metadata field holding the key the copy was written for
+PARQUET_KEY_FIELD = b'telco_cache_key'
+# Dataset versions each data cache keeps in memory; entries for older versions of telco.csv are evicted
+DATA_CACHE_VERSIONS = 2
+
+def read_parquet_key(parquet_path: Path) -> str | None:
+    """
+    Cache key stored in the Parquet copy's metadata, or None when there is no readable copy.
+    """
+    try:
+        metadata = pq.read_schema(parquet_path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    key = metadata.get(PARQUET_KEY_FIELD)
+    return key.decode() if key is not None else None
+
+def write_parquet_copy(df_: pd.DataFrame, parquet_path: Path, cache_key: str):
+    """
+    Writes the typed frame as a zstd Parquet file tagged with `cache_key`.
+    """
+    table = pa.Table.from_pandas(df_)
+    table = table.replace_schema_metadata({**table.schema.metadata, PARQUET_KEY_FIELD: cache_key.encode()})
+    pq.write_table(table, parquet_path, compression='zstd')
+
+def data_signature(file_path: str) -> str:
+    """
+    Key of the current dataset: the CSV's (mtime, size) plus the load schema. Every cache derived
+    from the data takes it as an argument, so an edited file or schema never serves old results.
+    """
+    stat = Path(file_path).stat()
+    return f"{stat.st_mtime_ns}-{stat.st_size}-{SCHEMA_KEY}"
+
+# persist="disk": the prepared frame also survives app restarts, not only reruns. The
+# persisted entry is keyed on the arguments only; data_key carries the CSV state and schema.
+@st.cache_data(persist="disk", max_entries=DATA_CACHE_VERSIONS)
+def load_data(file_path: str, data_key: str) -> pd.DataFrame:
+    """
+    Loads the used columns of the telco dataset with compact dtypes (low-cardinality text as
+    'category', Yes/No service flags as bool), fills specified columns' NaN with 'Unknown' and adds
+    the (ordered) Tenure Group and Age Group bins. The CSV is parsed once and kept as a typed
+    Parquet file next to it, tagged with `data_key`, which later loads read instead while the
+    tag still matches. Without pyarrow the CSV is read with pandas' C parser on every cold start.
+    """
+    if HAS_PYARROW:
+        parquet_path = Path(file_path).with_suffix('.parquet')
+        if read_parquet_key(parquet_path) == data_key:
+            df_ = pd.read_parquet(parquet_path, columns=USED_COLUMNS)
+        else:
+            # Arrow's multithreaded CSV reader; columns still come back as NumPy/categorical dtypes
+            df_ = pd.read_csv(file_path, engine='pyarrow', usecols=USED_COLUMNS, dtype=COLUMN_DTYPES)
+            df_ = df_[USED_COLUMNS]
+            try:
+                write_parquet_copy(df_, parquet_path, data_key)
+            except OSError:
+                # e.g. a read-only app directory: keep the parsed frame, re-parse on the next cold start
+                pass
+    else:
+        df_ = pd.read_csv(file_path, usecols=USED_COLUMNS, dtype=COLUMN_DTYPES)
+        df_ = df_[USED_COLUMNS]
+    cols_to_change = ['Churn Reason', 'Churn Category', 'Internet Type', 'Offer']
+    for col in cols_to_change:
+        df_[col] = df_[col].cat.add_categories('Unknown').fillna('Unknown')
+    # Service flags become bool once here, so counts and masks need no 'Yes' comparison later
+    df_[SERVICE_COLUMNS] = df_[SERVICE_COLUMNS].eq('Yes')
+
+    df_["Tenure Group"] = pd.cut(
+        df_["Tenure in Months"],
         bins=TENURE_BINS,
         labels=TENURE_LABELS,
         right=True
     )
-    return df
+    df_["Age Group"] = pd.cut(
+        df_["Age"],
+        bins=AGE_BINS,
+        labels=AGE_LABELS,
+        right=False
+    )
+    return df_
+
+def observed_counts(series: pd.Series) -> pd.Series:
+    """
+    value_counts() restricted to the values that actually occur (categoricals also report empty categories).
+    """
+    counts = series.value_counts()
+    return counts[counts > 0]
+
+def observed_shares(series: pd.Series) -> pd.Series:
+    """
+    Percentage of the series taken by each value that actually occurs, from one normalised value_counts().
+    """
+    shares = series.value_counts(normalize=True) * 100
+    return shares[shares > 0]
+
+def top_counts(series: pd.Series, n: int) -> pd.Series:
+    """
+    The n most frequent values of the series, picked by a partial sort of the unsorted counts.
+    """
+    counts = series.value_counts(sort=False)
+    return counts[counts > 0].nlargest(n)
+
+@st.cache_data(max_entries=DATA_CACHE_VERSIONS)
+def load_service_matrix(file_path: str, data_key: str) -> np.ndarray:
+    """
+    int8 matrix (customers x services) with 1 where the customer subscribes to the service.
+    """
+    # to_numpy() of a multi-column frame is column-major; row order keeps each customer's
+    # 11 flags contiguous for the per-selection row take
+    return np.ascontiguousarray(load_data(file_path, data_key)[SERVICE_COLUMNS].to_numpy(dtype=np.int8))
+
+@st.cache_data(max_entries=DATA_CACHE_VERSIONS)
+def load_service_totals(file_path: str, data_key: str) -> np.ndarray:
+    """
+    Number of subscribers of each service over the whole dataset (independent of the filters).
+    """
+    return load_service_matrix(file_path, data_key).sum(axis=0)
 
 # ----------------------------------------------------
-# CLTV Trend Plot (Line Color Changed to Gold)
+# Filtering and Cached Figure Builders
 # ----------------------------------------------------
-def plot_cltv_trend(df):
-    # Ensure Tenure Group is in the correct (ordered) categorical format
-    df["Tenure Group"] = pd.Categorical(
-        df["Tenure Group"],
-        categories=TENURE_LABELS,
-        ordered=True
+GENDER_OPTIONS = ["All", "Male", "Female"]
+CHURN_OPTIONS = ["Yes", "No"]
+# Per-selection caches hold every sidebar selection of the kept dataset versions
+SELECTION_CACHE_ENTRIES = DATA_CACHE_VERSIONS * len(GENDER_OPTIONS) * len(CHURN_OPTIONS)
+# Columns shown with a top-values map (Churn Category, Churn Reason)
+TOP_MAP_COLUMNS = 2
+
+# Summary charts (service bar, age-group pies) are read, not explored: render them
+# as static images without hover/zoom handlers or the mode bar. Maps stay interactive.
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+@st.cache_data(max_entries=DATA_CACHE_VERSIONS)
+def load_filter_index(file_path: str, data_key: str) -> dict[tuple[str, str], np.ndarray]:
+    """
+    Row positions for every (gender, churn) sidebar selection, computed once per dataset version.
+    """
+    df_ = load_data(file_path, data_key)
+    return {
+        (gender, churn): np.flatnonzero(
+            ((gender == "All") | (df_["Gender"] == gender)) & (df_["Churn Label"] == churn)
+        )
+        for gender in GENDER_OPTIONS
+        for churn in CHURN_OPTIONS
+    }
+
+def filter_rows(data_key: str, gender_filter: str, churn_filter: str) -> np.ndarray:
+    """
+    Row positions of the customers matching the sidebar gender and churn selections.
+    """
+    return load_filter_index(DATA_PATH, data_key)[(gender_filter, churn_filter)]
+
+def filter_data(data_key: str, gender_filter: str, churn_filter: str) -> pd.DataFrame:
+    """
+    Returns the rows of the dataset matching the sidebar gender and churn selections.
+    """
+    return load_data(DATA_PATH, data_key).iloc[filter_rows(data_key, gender_filter, churn_filter)]
+
+@st.cache_data(max_entries=SELECTION_CACHE_ENTRIES)
+def compute_service_churn(data_key: str, gender_filter: str, churn_filter: str) -> np.ndarray:
+    """
+    Share of each service's subscribers that fall in the current selection, as a percentage
+    (aligned with SERVICE_COLUMNS).
+    """
+    # One int8 matrix (customers x services), reduced column-wise for all services at once
+    rows = filter_rows(data_key, gender_filter, churn_filter)
+    churn_counts = load_service_matrix(DATA_PATH, data_key)[rows].sum(axis=0)
+    total_counts = load_service_totals(DATA_PATH, data_key)
+    return np.divide(
+        churn_counts, total_counts, out=np.zeros(len(SERVICE_COLUMNS)), where=total_counts > 0
+    ) * 100
+
+def top_churn_counts(df_filtered: pd.DataFrame, column: str, n: int) -> pd.Series:
+    """
+    The n most frequent values of `column` among customers with a known churn reason.
+    """
+    churned_data_filtered = df_filtered[df_filtered['Churn Reason'] != 'Unknown']
+    return top_counts(churned_data_filtered[column], n)
+
+# Figures are cached per (data_key, gender, churn) selection, so reruns with unchanged
+# data and filters reuse the Plotly objects instead of rebuilding them. The builders return
+# go.Figure rather than plain dicts: st.plotly_chart re-validates dict input by
+# rebuilding a Figure, while an existing Figure is only serialised.
+@st.cache_resource(max_entries=SELECTION_CACHE_ENTRIES)
+def build_service_bar(data_key: str, gender_filter: str, churn_filter: str) -> go.Figure:
+    service_churn_pct = compute_service_churn(data_key, gender_filter, churn_filter)
+    min_churn_percentage = service_churn_pct.min()
+    max_churn_percentage = service_churn_pct.max()
+
+    fig = go.Figure(go.Bar(
+        x=SERVICE_COLUMNS,
+        y=service_churn_pct,
+        marker=dict(color=service_churn_pct, colorscale="Viridis"),
+        hovertemplate="Service=%{x}<br>Churn %=%{y}<extra></extra>"
+    ))
+    fig.update_layout(
+        xaxis_title="Service",
+        yaxis_title="Churn Percentage (%)",
+        xaxis_tickangle=-45,
+        yaxis_range=[min_churn_percentage - 5, max_churn_percentage + 5],
+        margin=dict(l=10, r=10, t=40, b=50)
+    )
+    return fig
+
+# Zoom level from which individual customers are drawn instead of point clusters
+MAP_CLUSTER_MAXZOOM = 8
+
+def build_scatter_map(data: pd.DataFrame, color_col: str, palette: list[str] | dict[str, str],
+                      zoom: float) -> go.Figure:
+    """
+    Customer scatter map with one WebGL go.Scattermapbox trace per value of `color_col`.
+    Traces are fed NumPy arrays directly, skipping Plotly Express' per-trace DataFrame handling,
+    and nearby points are clustered in the browser until the user zooms in past MAP_CLUSTER_MAXZOOM.
+    `palette` is either a colour sequence (cycled in trace order) or a fixed value -> colour mapping.
+    """
+    fig = go.Figure()
+    for i, (value, group) in enumerate(data.groupby(color_col, observed=True, sort=False)):
+        fig.add_trace(go.Scattermapbox(
+            lat=group['Latitude'].to_numpy(),
+            lon=group['Longitude'].to_numpy(),
+            mode='markers',
+            name=str(value),
+            legendgroup=str(value),
+            marker=dict(color=palette[value] if isinstance(palette, dict) else palette[i % len(palette)]),
+            cluster=dict(enabled=True, maxzoom=MAP_CLUSTER_MAXZOOM, step=50),
+            hovertext=group['Customer ID'].to_numpy(),
+            customdata=group[['Age', 'Contract']].to_numpy(),
+            hovertemplate=(
+                f"<b>%{{hovertext}}</b><br><br>{color_col}={value}<br>"
+                "Latitude=%{lat}<br>Longitude=%{lon}<br>"
+                "Age=%{customdata[0]}<br>Contract=%{customdata[1]}<extra></extra>"
+            )
+        ))
+    fig.update_layout(
+        mapbox_style="carto-positron",
+        mapbox_center={"lat": data['Latitude'].mean(), "lon": data['Longitude'].mean()},
+        mapbox_zoom=zoom,
+        legend=dict(title=dict(text=color_col), tracegroupgap=0),
+        margin=dict(t=60)
+    )
+    return fig
+
+@st.cache_resource(max_entries=SELECTION_CACHE_ENTRIES * TOP_MAP_COLUMNS)
+def build_top_map(column: str, n: int, data_key: str, gender_filter: str, churn_filter: str,
+                  palette: tuple[str, ...]) -> go.Figure | None:
+    """
+    Map of the customers whose `column` value is among the selection's n most frequent ones,
+    or None when there is nothing to plot.
+    """
+    df_filtered = filter_data(data_key, gender_filter, churn_filter)
+    top_values = top_churn_counts(df_filtered, column, n)
+    # On a categorical column isin() matches the set against the category codes, not per-row strings
+    top_data = df_filtered[df_filtered[column].isin(set(top_values.index))]
+    if top_data.empty:
+        return None
+
+    return build_scatter_map(top_data, column, list(palette), zoom=3.5)
+
+def filter_competition(df_filtered: pd.DataFrame) -> pd.DataFrame:
+    """
+    Customers in the given selection whose churn reason involves a competitor.
+    """
+    return df_filtered[df_filtered["Churn Reason"].str.contains("Competitor", na=False)]
+
+@st.cache_resource(max_entries=SELECTION_CACHE_ENTRIES * len(AGE_LABELS))
+def build_age_group_map(data_key: str, gender_filter: str, churn_filter: str, age_group: str) -> go.Figure | None:
+    """
+    Map of one age group's competitor-driven churn, or None when the group is empty.
+    The subset, its map centre and the figure are all cached per selection.
+    """
+    df_competition = filter_competition(filter_data(data_key, gender_filter, churn_filter))
+    df_group = df_competition[df_competition["Age Group"] == age_group]
+    if df_group.empty:
+        return None
+
+    # Fixed color mapping for churn reasons, shared by the three age-group maps
+    unique_reasons = df_competition["Churn Reason"].unique()
+    fixed_colors = px.colors.qualitative.Set1  # Choose a consistent color scheme
+    color_mapping = {reason: fixed_colors[i % len(fixed_colors)] for i, reason in enumerate(unique_reasons)}
+
+    fig_map = build_scatter_map(df_group, 'Churn Reason', color_mapping, zoom=5)
+    fig_map.update_layout(
+        legend=dict(
+            orientation="h",  # Horizontal legend
+            y=-0.2,           # Move legend below the map
+            x=0.5,            # Center the legend
+            xanchor="center",
+        )
+    )
+    return fig_map
+
+# One colour per churn category, so a category keeps its colour whatever its slice position
+# (value_counts() on a categorical breaks count ties by category order)
+CATEGORY_COLORS = {
+    "Competitor": "#E63946",
+    "Attitude": "#457B9D",
+    "Dissatisfaction": "#F4A261",
+    "Price": "#2A9D8F",
+    "Other": "#8D99AE",
+    "Unknown": "#CED4DA",
+}
+# Cycled, by slice position, for categories missing from CATEGORY_COLORS (e.g. after a telco.csv edit)
+CATEGORY_FALLBACK_COLORS = px.colors.qualitative.Pastel
+
+@st.cache_resource(max_entries=SELECTION_CACHE_ENTRIES * len(AGE_LABELS))
+def build_age_group_pie(data_key: str, gender_filter: str, churn_filter: str, age_group: str) -> go.Figure | None:
+    """
+    Donut chart of one age group's churn categories, or None when the group is empty.
+    """
+    df_filtered = filter_data(data_key, gender_filter, churn_filter)
+    churn_reasons = observed_counts(df_filtered[df_filtered['Age Group'] == age_group]['Churn Category'])
+    if churn_reasons.empty:
+        return None
+
+    # Plain lists and a layout given up front: no Series conversion or extra layout merge
+    labels = churn_reasons.index.tolist()
+    return go.Figure(
+        go.Pie(
+            labels=labels,
+            values=churn_reasons.tolist(),
+            hole=0.4,  # Donut-style
+            marker=dict(colors=[
+                CATEGORY_COLORS.get(c, CATEGORY_FALLBACK_COLORS[i % len(CATEGORY_FALLBACK_COLORS)])
+                for i, c in enumerate(labels)
+            ]),
+        ),
+        layout=dict(title=f"Churn Reasons - {age_group}"),
     )
-    cltv_by_tenure = df.groupby("Tenure Group")["CLTV"].mean().reset_index()
+
+# Maps are the heaviest figures, so they are only built once the user switches them on.
+# The toggles live in fragments: flipping one reruns only its map block, not the whole report.
+@st.fragment
+def show_top_map(column: str, n: int, data_key: str, gender_filter: str, churn_filter: str,
+                 palette: tuple[str, ...], toggle_key: str):
+    if st.toggle("Show map", key=toggle_key):
+        fig_map = build_top_map(column, n, data_key, gender_filter, churn_filter, palette)
+        if fig_map is not None:
+            st.plotly_chart(fig_map, use_container_width=True)
+        else:
+            st.info("No geographical data available for this selection.")
+
+@st.fragment
+def show_age_group_maps(data_key: str, gender_filter: str, churn_filter: str):
+    if st.toggle("Show maps", key="show_age_group_maps"):
+        col10, col11, col12 = st.columns(3)
+
+        for col, age_group, age_label in zip([col10, col11, col12], AGE_LABELS, AGE_COMPETITION_LABELS):
+            with col:
+                st.markdown(f"### 🌍 {age_label}")
+                fig_map = build_age_group_map(data_key, gender_filter, churn_filter, age_group)
+                if fig_map is not None:
+                    st.plotly_chart(fig_map, use_container_width=True)
+                else:
+                    st.info(f"No geographical data available for {age_label}")
+
+# ----------------------------------------------------
+# CLTV Trend Plot (Line Color Changed to Gold)
+# ----------------------------------------------------
+@st.cache_resource(max_entries=SELECTION_CACHE_ENTRIES)
+def build_cltv_line(data_key: str, gender_filter: str, churn_filter: str) -> go.Figure:
+    """
+    Builds the gold CLTV-by-tenure line chart for one sidebar filter selection.
+    """
+    df = filter_data(data_key, gender_filter, churn_filter)
+
+    # Mean CLTV per tenure bin from two bincounts over the category codes (empty bins stay NaN)
+    n_bins = len(TENURE_LABELS)
+    codes = df["Tenure Group"].cat.codes.to_numpy()
+    cltv_sums = np.bincount(codes, weights=df["CLTV"].to_numpy(), minlength=n_bins)
+    bin_counts = np.bincount(codes, minlength=n_bins)
+    cltv_by_tenure = np.divide(cltv_sums, bin_counts, out=np.full(n_bins, np.nan), where=bin_counts > 0)
 
     # Create the figure
-    fig = px.line(
-        cltv_by_tenure,
-        x="Tenure Group",
-        y="CLTV",
-        markers=True,
+    fig = go.Figure(go.Scatter(
+        x=TENURE_LABELS,
+        y=cltv_by_tenure,
+        mode="lines+markers",
+        line=dict(color="gold", width=3),
+        hovertemplate="Tenure Group=%{x}<br>Average CLTV=%{y}<extra></extra>"
+    ))
+    fig.update_layout(
         title="📈 CLTV Trend by Tenure Group",
-        labels={"CLTV": "Average CLTV", "Tenure Group": "Tenure Group"}
+        xaxis_title="Tenure Group",
+        yaxis_title="Average CLTV"
     )
-    fig.update_traces(line=dict(color="gold", width=3))
     fig.update_xaxes(tickangle=-45)
+    return fig
+
+def plot_cltv_trend(data_key: str, gender_filter: str, churn_filter: str):
+    fig = build_cltv_line(data_key, gender_filter, churn_filter)
 
     # Use two columns: one for the chart, one for the legend
     col_chart, col_legend = st.columns([6, 1])  # Adjusts width ratio 
@@ -94,8 +494,166 @@ def plot_cltv_trend(df):
         )
 
 
-# Load Data
-df = load_data('telco.csv')
+# ----------------------------------------------------
+# Insight Texts
+# ----------------------------------------------------
+# Each expander renders its text with one st.markdown call (one element per rerun
+# instead of a subheader/write pair per point).
+INSIGHTS_SERVICE_CHURN = """
+### 📌 General Churn Trends
+
+**Conclusion:** The services with the highest cancellation rates are Internet, Unlimited Data, and Streaming Services.
+
+### 📌 Internet and Data Churn
+
+**Conclusion:** Customers using Internet services (31.83%) and Unlimited Data (31.65%) have the highest cancellation rates.
+
+### 📌 Streaming Services Churn
+
+**Conclusion:** TV Streaming (30.07%), Film Streaming (29.94%), and Music Streaming (29.26%) also show high cancellation rates.
+"""
+
+INSIGHTS_CHURN_CATEGORIES = """
+### 📌 General Churn Trends
+
+**Conclusion:** Competitor influence is the main reason for cancellations.
+
+### 📌 Churn Trends Among Men
+
+**Conclusion:** Male customers primarily cancel due to competitor influence and dissatisfaction with services.
+
+### 📌 Churn Trends Among Women
+
+**Conclusion:** Female customers are more likely to cancel due to competitor influence and pricing.
+"""
+
+INSIGHTS_CATEGORY_MAP = """
+### 📍 High Concentration of Cancellations in Urban Areas
+
+**Observation:** Most cancellations are concentrated in highly populated cities (San Francisco, Los Angeles, and San Diego), indicating that urban customers are more likely to switch providers due to increased competition.
+
+### 🏆 Competitor Influence is a Key Factor Across All Regions
+
+**Observation:** The most frequent churn category is 'Competition' (orange points), suggesting that many customers are switching to other service providers.
+
+### 📞 Dissatisfaction and Customer Service Issues Vary by Location
+
+**Observation:** Purple points (Attitude) and blue points (Dissatisfaction) are spread across various regions, indicating that **service quality and customer interactions vary by location**.
+
+### 💰 Price Concerns Are More Evenly Distributed
+
+**Observation:** Green points (Price) are evenly distributed on the map, indicating that **price sensitivity is not restricted to a specific location**.
+"""
+
+INSIGHTS_CHURN_BY_GENDER = """
+### 📌 Churn Among Women
+
+**Conclusion:** Women primarily cancel due to competitor pricing and device quality.
+
+### 📌 Churn Among Men
+
+**Conclusion:** Device quality is the main concern for male customers.
+"""
+
+INSIGHTS_REASON_MAP = """
+### 📍 High Concentration of Cancellations in Urban Areas
+
+**Observation:** Most cancellations are concentrated in highly populated cities (San Francisco, Los Angeles, and San Diego).
+
+### 🏆 Competitor Influence is a Key Factor Across All Regions
+
+**Observation:** The most frequent churn category is 'Competition'.
+
+### 📞 Dissatisfaction and Customer Service Issues Vary by Location
+
+**Observation:** Purple points (Attitude) and blue points (Dissatisfaction) are spread across different regions.
+
+### 💰 Price Concerns Are More Evenly Distributed
+
+**Observation:** Green points (Price) are widely distributed across the map.
+"""
+
+INSIGHTS_AGE_AND_REASON = """
+### 📌 General Churn Trends
+
+**Conclusion:** Most customers who cancel are in the **Over 50** age group (~50%), with the main reason being **Competition**, followed by **Price** and **Dissatisfaction**.
+
+### 📊 Churn by Age Group
+
+- **(Over 50 years)**: They have the highest churn rate. Main reasons include:
+    - More attractive offers from competitors.
+    - Dissatisfaction with the service experience.
+
+- **(30-50 years)**: Represent around 25% of cancellations, mainly due to:
+    - High prices and seeking cheaper plans.
+    - Service quality and customer support influencing decisions to switch.
+
+- **(Under 30 years)**: Although the lowest churn rate, they still:
+    - Tend to switch providers more frequently.
+    - Prefer flexible plans with no long-term commitment.
+"""
+
+INSIGHTS_CLTV_BY_TENURE = """
+### ⚡ CLTV for Short-Term Customers (0–6 months)
+
+**Observation:** Newly acquired customers (0–6 months) tend to have a lower CLTV—this may reflect short billing cycles, introductory offers, or limited usage.
+
+### 📈 CLTV for Medium-Term Customers (7–36 months)
+
+**Observation:** CLTV gradually increases between 7 and 36 months as customers adopt more services or bundled options.
+
+### 🏆 CLTV for Long-Term Customers (49–60 months)
+
+**Observation:** There is often a peak in the 49–60 month range, indicating that long-term customers perceive more value and spend more.
+
+### 🔄 Stabilization or Slight Decline After 61+ Months
+
+**Observation:** Some older customers may stabilize or slightly reduce their spending—they may no longer need additional services or could be exploring alternatives.
+"""
+
+STRATEGY_SUGGESTIONS = """
+## **Overview of Recommendations**
+
+### 📌 Insights on Churn by Age Group
+
+**Strategy:** Consider **special offer campaigns for seniors/families** or **long-term discounted bundles** to retain high-value customers.
+
+### 📌 Insights on Churn by Contract Type
+
+**Strategy:** Provide **effective onboarding experiences and initial incentives** for monthly contracts, promoting loyalty early on.
+
+**Strategy:** Encourage **cross-selling of additional services**, mid-contract upgrades, or loyalty rewards to increase customer value.
+
+### **Key Churn Factors and Strategies to Mitigate Them**
+
+#### ✔️ **Competition**
+
+**Strategy:** Strengthen **loyalty programs** and offer **competitive bundles** to retain customers.
+
+#### 📉 **Dissatisfaction**
+
+**Strategy:** Improve **service quality, network coverage, and customer experience** to reduce churn caused by dissatisfaction.
+
+#### 🤝 **Customer Service**
+
+**Strategy:** Invest in **regional training for support teams** and **optimize customer service** processes.
+
+#### 🌍 **Location-Based Churn**
+
+**Strategy:** Implement **location-specific retention offers**, focusing on urban areas with higher churn rates.
+
+#### 💰 **Price and Perceived Value**
+
+**Strategy:** Offer **tiered pricing plans** and **regional discounts** to improve affordability and retention.
+
+#### 🏆 **Retaining High-Value & Long-Term Customers**
+
+**Strategy:** Provide **loyalty benefits, VIP support lines, or device upgrades** to reward and retain these valuable customers.
+
+### 🔍 Final Observations
+
+**Senior and middle-aged customers** are the most likely to cancel due to competitor offers and dissatisfaction with services. Meanwhile, **younger customers** seek greater flexibility, often preferring short-term contracts.
+"""
 
 # ----------------------------------------------------
 # 3. Main Title and Description
@@ -130,85 +688,45 @@ with st.sidebar:
         "Adjust the options below to analyze specific customer segments."
     )
     
-    gender_filter = st.radio("Select Gender", options=["All", "Male", "Female"], index=0)
-    churn_filter = st.radio("Select Churn Status", options=["Yes", "No"], index=0)
+    gender_filter = st.radio("Select Gender", options=GENDER_OPTIONS, index=0)
+    churn_filter = st.radio("Select Churn Status", options=CHURN_OPTIONS, index=0)
 
 # ----------------------------------------------------
 # 5. Filter the Data Based on Sidebar Selections
 # ----------------------------------------------------
-df_filtered = df.copy()
-
-if gender_filter != "All":
-    df_filtered = df_filtered[df_filtered["Gender"] == gender_filter].copy()
-
-df_filtered = df_filtered[df_filtered["Churn Label"] == churn_filter].copy()
+# Identifies the dataset version; every cached result below is keyed on it
+data_key = data_signature(DATA_PATH)
+df_filtered = filter_data(data_key, gender_filter, churn_filter)
 
 # ----------------------------------------------------
 # 6. Section 1: Which Services Tend to Have High Churn?
 # ----------------------------------------------------
 st.subheader("Question 1: Which services tend to have a high churn rate?")
 
-service_columns = [
-    "Phone Service", "Internet Service", "Multiple Lines",
-    "Streaming TV", "Streaming Movies", "Streaming Music",
-    "Online Security", "Online Backup", "Device Protection Plan",
-    "Premium Tech Support", "Unlimited Data"
-]
-
-service_churn_dict = {}
-for service in service_columns:
-    service_users = df_filtered[df_filtered[service] == 'Yes']
-    churn_count = service_users.shape[0]  # Already filtered to churn = Yes
-    total_users = df[df[service] == 'Yes'].shape[0]
-    churn_percentage = (churn_count / total_users * 100) if total_users > 0 else 0
-    service_churn_dict[service] = churn_percentage
-
-service_churn_df = pd.DataFrame(service_churn_dict, index=["Churn Percentage"]).T
+service_churn_pct = compute_service_churn(data_key, gender_filter, churn_filter)
 
 col1, col2 = st.columns(2)
 
 with col1:
     st.markdown("### Top 10 Services by Churn Rate")
-    top_5_services = service_churn_df.sort_values(by="Churn Percentage", ascending=False).head(10)
-    st.dataframe(top_5_services)
+    top_services = np.argsort(-service_churn_pct, kind="stable")[:10]
+    st.dataframe(
+        {"Service": np.take(SERVICE_COLUMNS, top_services), "Churn Percentage": service_churn_pct[top_services]},
+        hide_index=True
+    )
 
 with col2:
     st.markdown("### Churn Percentage by Service")
     
-    if not service_churn_df.empty:
-        min_churn_percentage = service_churn_df["Churn Percentage"].min()
-        max_churn_percentage = service_churn_df["Churn Percentage"].max()
-
-        fig = px.bar(
-            service_churn_df,
-            x=service_churn_df.index,
-            y="Churn Percentage",
-            color="Churn Percentage",
-            color_continuous_scale="viridis",
-            labels={"x": "Service", "Churn Percentage": "Churn %"},
-        )
-        fig.update_layout(
-            xaxis_title="Service",
-            yaxis_title="Churn Percentage (%)",
-            xaxis_tickangle=-45,
-            yaxis_range=[min_churn_percentage - 5, max_churn_percentage + 5],
-            margin=dict(l=10, r=10, t=40, b=50),
-            coloraxis_showscale=False
-        )
-        st.plotly_chart(fig, use_container_width=True)
+    if service_churn_pct.size:
+        st.plotly_chart(build_service_bar(data_key, gender_filter, churn_filter), use_container_width=True,
+                        config=STATIC_CHART_CONFIG)
     else:
         st.info("No data available to plot. Try changing your filters.")
 
 # Expander for insights
 with st.expander("💡 Click to view information on churn by service"):
-    st.subheader("📌 General Churn Trends")
-    st.write("**Conclusion:** The services with the highest cancellation rates are Internet, Unlimited Data, and Streaming Services.")
-
-    st.subheader("📌 Internet and Data Churn")
-    st.write("**Conclusion:** Customers using Internet services (31.83%) and Unlimited Data (31.65%) have the highest cancellation rates.")
-
-    st.subheader("📌 Streaming Services Churn")
-    st.write("**Conclusion:** TV Streaming (30.07%), Film Streaming (29.94%), and Music Streaming (29.26%) also show high cancellation rates.")
+    st.markdown(INSIGHTS_SERVICE_CHURN)
 
 st.write("---")
 
@@ -220,11 +738,9 @@ st.subheader("Question 2: What would we do to reduce churn?")
 if df_filtered.empty:
     st.warning("No churned customers found based on the selected filters. Try adjusting the filters.")
 else:
-    churned_data_filtered = df_filtered[df_filtered['Churn Reason'] != 'Unknown'].copy()
-    
-    top_churn_reasons = churned_data_filtered['Churn Reason'].value_counts().head(10)
+    top_churn_reasons = top_churn_counts(df_filtered, 'Churn Reason', 10)
     # Top Churn Categories
-    top_churn_categories = churned_data_filtered['Churn Category'].value_counts().head(5)
+    top_churn_categories = top_churn_counts(df_filtered, 'Churn Category', 5)
 
     col3, col4 = st.columns(2)
 
@@ -237,57 +753,18 @@ else:
     with col4:
         st.markdown("### 🌍 Geographic Distribution of the Top 5 Churn Categories")
         if 'Latitude' in df_filtered.columns and 'Longitude' in df_filtered.columns:
-            top_category_data = df_filtered[df_filtered['Churn Category'].isin(top_churn_categories.index)]
-            if not top_category_data.empty:
-                lat_center = top_category_data['Latitude'].mean()
-                lon_center = top_category_data['Longitude'].mean()
-
-                fig_map_category = px.scatter_mapbox(
-                    top_category_data,
-                    lat="Latitude", lon="Longitude",
-                    color="Churn Category",
-                    hover_name="Customer ID",
-                    hover_data=["Age", "Contract"],
-                    color_discrete_sequence=px.colors.qualitative.Vivid,
-                    zoom=3.5
-                )
-                fig_map_category.update_layout(
-                    mapbox_style="carto-positron",
-                    mapbox_center={"lat": lat_center, "lon": lon_center}
-                )
-                st.plotly_chart(fig_map_category, use_container_width=True)
-            else:
-                st.info("No geographical data available for this selection.")
+            show_top_map(
+                'Churn Category', 5, data_key, gender_filter, churn_filter, tuple(px.colors.qualitative.Vivid),
+                toggle_key="show_category_map"
+            )
         else:
             st.info("No geographical data available for mapping.")
 
 with st.expander("💡 Click to view insights on churn categories"):
-    st.subheader("📌 General Churn Trends")
-    st.write("**Conclusion:** Competitor influence is the main reason for cancellations.")
-
-    st.subheader("📌 Churn Trends Among Men")
-    st.write("**Conclusion:** Male customers primarily cancel due to competitor influence and dissatisfaction with services.")
-
-    st.subheader("📌 Churn Trends Among Women")
-    st.write("**Conclusion:** Female customers are more likely to cancel due to competitor influence and pricing.")
+    st.markdown(INSIGHTS_CHURN_CATEGORIES)
 
 with st.expander("🌍 Click to view insights from the Geographic Churn Distribution Map"):
-
-    st.subheader("📍 High Concentration of Cancellations in Urban Areas")
-    st.write("**Observation:** Most cancellations are concentrated in highly populated cities (San Francisco, Los Angeles, and San Diego), "
-             "indicating that urban customers are more likely to switch providers due to increased competition.")
-
-    st.subheader("🏆 Competitor Influence is a Key Factor Across All Regions")
-    st.write("**Observation:** The most frequent churn category is 'Competition' (orange points), suggesting "
-             "that many customers are switching to other service providers.")
-
-    st.subheader("📞 Dissatisfaction and Customer Service Issues Vary by Location")
-    st.write("**Observation:** Purple points (Attitude) and blue points (Dissatisfaction) are spread across various regions, "
-             "indicating that **service quality and customer interactions vary by location**.")
-
-    st.subheader("💰 Price Concerns Are More Evenly Distributed")
-    st.write("**Observation:** Green points (Price) are evenly distributed on the map, "
-             "indicating that **price sensitivity is not restricted to a specific location**.")
+    st.markdown(INSIGHTS_CATEGORY_MAP)
 
 col5, col6 = st.columns(2)
 
@@ -300,49 +777,18 @@ with col5:
 with col6:
     st.markdown("### 🌍 Geographic Distribution of the Top 5 Reasons for Churn")
     if 'Latitude' in df_filtered.columns and 'Longitude' in df_filtered.columns:
-        top_reason_data = df_filtered[df_filtered['Churn Reason'].isin(top_churn_reasons.index)]
-        if not top_reason_data.empty:
-            lat_center = top_reason_data['Latitude'].mean()
-            lon_center = top_reason_data['Longitude'].mean()
-
-            fig_map = px.scatter_mapbox(
-                top_reason_data,
-                lat="Latitude", lon="Longitude",
-                color="Churn Reason",
-                hover_name="Customer ID",
-                hover_data=["Age", "Contract"],
-                color_discrete_sequence=px.colors.qualitative.Pastel,
-                zoom=3.5
-            )
-            fig_map.update_layout(
-                mapbox_style="carto-positron",
-                mapbox_center={"lat": lat_center, "lon": lon_center}
-            )
-            st.plotly_chart(fig_map, use_container_width=True)
-        else:
-            st.info("No geographical data available for this selection.")
+        show_top_map(
+            'Churn Reason', 10, data_key, gender_filter, churn_filter, tuple(px.colors.qualitative.Pastel),
+            toggle_key="show_reason_map"
+        )
     else:
         st.info("No geographical data available for mapping.")
 
 with st.expander("💡 Click to view insights on churn by gender"):
-    st.subheader("📌 Churn Among Women")
-    st.write("**Conclusion:** Women primarily cancel due to competitor pricing and device quality.")
-
-    st.subheader("📌 Churn Among Men")
-    st.write("**Conclusion:** Device quality is the main concern for male customers.")
+    st.markdown(INSIGHTS_CHURN_BY_GENDER)
 
 with st.expander("🌍 Click to view insights from the Geographic Churn Distribution Map"):
-    st.subheader("📍 High Concentration of Cancellations in Urban Areas")
-    st.write("**Observation:** Most cancellations are concentrated in highly populated cities (San Francisco, Los Angeles, and San Diego).")
-
-    st.subheader("🏆 Competitor Influence is a Key Factor Across All Regions")
-    st.write("**Observation:** The most frequent churn category is 'Competition'.")
-
-    st.subheader("📞 Dissatisfaction and Customer Service Issues Vary by Location")
-    st.write("**Observation:** Purple points (Attitude) and blue points (Dissatisfaction) are spread across different regions.")
-
-    st.subheader("💰 Price Concerns Are More Evenly Distributed")
-    st.write("**Observation:** Green points (Price) are widely distributed across the map.")
+    st.markdown(INSIGHTS_REASON_MAP)
 
 st.write("---")
 
@@ -352,30 +798,12 @@ st.write("---")
 st.subheader("Question 3: What should be the strategy to reduce churn?")
 
 if not df_filtered.empty:
-    # Categorizing Age Groups (First approach)
-    def age_category(age):
-        if age < 30:
-            return '(Under 30 years)'
-        elif 30 <= age < 50:
-            return '(30-50 years)'
-        else:
-            return '(Over 50 years)'
-
-    df_filtered['Age Group'] = df_filtered['Age'].apply(age_category)
-
-    # Count churned customers per Age Group
-    churn_counts_by_age = df_filtered['Age Group'].value_counts().reset_index()
-    churn_counts_by_age.columns = ['Age Group', 'Churn Count']
-
-    # Calculate total churned customers (based on current filter)
-    total_churned = df_filtered.shape[0]
-
-    # Calculate churn percentage for each Age Group
-    churn_counts_by_age['Churn Percentage'] = (churn_counts_by_age['Churn Count'] / total_churned) * 100
+    # Churn percentage for each Age Group (share of the current selection)
+    churn_pct_by_age = observed_shares(df_filtered['Age Group'])
 
     # Create a single-line summary with percentages side by side
     churn_summary = " | ".join(
-        [f"✅ **{row['Age Group']}**: {row['Churn Percentage']:.2f}%" for _, row in churn_counts_by_age.iterrows()]
+        [f"✅ **{age_group}**: {pct:.2f}%" for age_group, pct in churn_pct_by_age.items()]
     )
 
     # Display the summary in a single line
@@ -390,214 +818,69 @@ age_groups = df_filtered['Age Group'].unique()
 cols = st.columns(len(age_groups))
 
 for i, age_group in enumerate(age_groups):
-    churn_reasons = df_filtered[df_filtered['Age Group'] == age_group]['Churn Category'].value_counts()
-    
-    if not churn_reasons.empty:
-        fig = go.Figure(
-            go.Pie(
-                labels=churn_reasons.index,
-                values=churn_reasons.values,
-                hole=0.4,  # Donut-style
-                marker=dict(colors=["#E63946", "#457B9D", "#F4A261", "#2A9D8F", "#8D99AE"]),
-            )
-        )
-        fig.update_layout(title=f"Churn Reasons - {age_group}")
+    fig = build_age_group_pie(data_key, gender_filter, churn_filter, age_group)
 
+    if fig is not None:
         with cols[i]:
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
 
 # Expander Section for Insights
 with st.expander("💡 Click to view insights on churn by age and reason"):
-    st.subheader("📌 General Churn Trends")
-    st.write(
-        "**Conclusion:** Most customers who cancel are in the **Over 50** age group (~50%), "
-        "with the main reason being **Competition**, followed by **Price** and **Dissatisfaction**."
-    )
-
-    st.subheader("📊 Churn by Age Group")
-    st.markdown("""
-    - **(Over 50 years)**: They have the highest churn rate. Main reasons include:
-        - More attractive offers from competitors.
-        - Dissatisfaction with the service experience.
-
-    - **(30-50 years)**: Represent around 25% of cancellations, mainly due to:
-        - High prices and seeking cheaper plans.
-        - Service quality and customer support influencing decisions to switch.
-
-    - **(Under 30 years)**: Although the lowest churn rate, they still:
-        - Tend to switch providers more frequently.
-        - Prefer flexible plans with no long-term commitment.
-    """)
+    st.markdown(INSIGHTS_AGE_AND_REASON)
 
 st.write('---')
 
-# Categorizing Age Groups (Second approach for competition analysis)
-def age_category_competition(age):
-    if age < 30:
-        return "Under 30"
-    elif 30 <= age < 50:
-        return "30-50"
-    else:
-        return "50+"
-
-df_filtered['Age Group'] = df_filtered['Age'].apply(age_category_competition)
-
 # Filter churn cases where the reason is "Competition"
-df_competition = df_filtered[df_filtered["Churn Reason"].str.contains("Competitor", na=False)].copy()
-
-# Define fixed color mapping for churn reasons
-unique_reasons = df_competition["Churn Reason"].unique()
-fixed_colors = px.colors.qualitative.Set1  # Choose a consistent color scheme
-color_mapping = {reason: fixed_colors[i % len(fixed_colors)] for i, reason in enumerate(unique_reasons)}
+df_competition = filter_competition(df_filtered)
 
 # --- Layout for Tables ---
 st.subheader("📊 Churn Reasons by Age Group")
 col7, col8, col9 = st.columns(3)
 
-for col, age_group in zip([col7, col8, col9], ["Under 30", "30-50", "50+"]):
+for col, age_group, age_label in zip([col7, col8, col9], AGE_LABELS, AGE_COMPETITION_LABELS):
     df_group = df_competition[df_competition["Age Group"] == age_group]
     
     with col:
-        st.markdown(f"### 🏆 {age_group}")
+        st.markdown(f"### 🏆 {age_label}")
         if not df_group.empty:
-            df_table = df_group["Churn Reason"].value_counts().head(5).reset_index()
+            df_table = top_counts(df_group["Churn Reason"], 5).reset_index()
             df_table.columns = ["Churn Reason", "Count"]
             st.dataframe(df_table, hide_index=True)
         else:
-            st.info(f"No data available for {age_group}")
+            st.info(f"No data available for {age_label}")
 
 st.write("---")
 
 # --- Layout for Maps ---
 st.subheader("🌍 Geographic Distribution of Churn by Age Group")
-col10, col11, col12 = st.columns(3)
 
-for i, (col, age_group) in enumerate(zip([col10, col11, col12], ["Under 30", "30-50", "50+"])):
-    df_group = df_competition[df_competition["Age Group"] == age_group]
-    
-    with col:
-        st.markdown(f"### 🌍 {age_group}")
-        if not df_group.empty:
-            lat_center = df_group["Latitude"].mean()
-            lon_center = df_group["Longitude"].mean()
-
-            fig_map = px.scatter_mapbox(
-                df_group,
-                lat="Latitude", lon="Longitude",
-                color="Churn Reason",
-                hover_name="Customer ID",
-                hover_data=["Age", "Contract"],
-                color_discrete_map=color_mapping,  # Apply fixed colors
-                zoom=5
-            )
-            
-            fig_map.update_layout(
-                mapbox_style="carto-positron",
-                mapbox_center={"lat": lat_center, "lon": lon_center},
-                legend=dict(
-                    orientation="h",  # Horizontal legend
-                    y=-0.2,           # Move legend below the map
-                    x=0.5,            # Center the legend
-                    xanchor="center",
-                )
-            )
-            st.plotly_chart(fig_map, use_container_width=True)
-        else:
-            st.info(f"No geographical data available for {age_group}")
+show_age_group_maps(data_key, gender_filter, churn_filter)
 
 st.write("---")
 
-# Preprocess data for Tenure Group
-df_filtered = preprocess_data(df_filtered)
-
 # Ensure 'Contract' column exists before processing
 if 'Contract' in df_filtered.columns:
-    # Count churned customers per Contract Type
-    churn_counts_by_contract = df_filtered['Contract'].value_counts().reset_index()
-    churn_counts_by_contract.columns = ['Contract Type', 'Churn Count']
-
-    # Since we defined total_churned earlier, ensure it exists
-    # (If the user changes filters midway, re-calculate as needed.)
-    total_churned = len(df_filtered)
-    if total_churned > 0:
-        churn_counts_by_contract['Churn Percentage'] = (
-            churn_counts_by_contract['Churn Count'] / total_churned
-        ) * 100
+    if not df_filtered.empty:
+        # Churn percentage for each Contract Type (share of the current selection)
+        churn_pct_by_contract = observed_shares(df_filtered['Contract'])
 
         churn_summary_contract = " | ".join(
-            [f"📜 **{row['Contract Type']}**: {row['Churn Percentage']:.2f}%" for _, row in churn_counts_by_contract.iterrows()]
+            [f"📜 **{contract}**: {pct:.2f}%" for contract, pct in churn_pct_by_contract.items()]
         )
         st.markdown(f"📞 **Churn Rate by Contract Type:** {churn_summary_contract}")
     else:
         st.info("No churned customers to calculate Contract Type percentages.")
 
 # Display the gold line chart
-plot_cltv_trend(df_filtered)
+plot_cltv_trend(data_key, gender_filter, churn_filter)
 
 # Add an expander with additional insights on CLTV by tenure group
 with st.expander("🔍 Click to view insights on CLTV by tenure group"):
-
-    st.subheader("⚡ CLTV for Short-Term Customers (0–6 months)")
-    st.write("**Observation:** Newly acquired customers (0–6 months) tend to have a lower CLTV—"
-             "this may reflect short billing cycles, introductory offers, or limited usage.")
-
-    st.subheader("📈 CLTV for Medium-Term Customers (7–36 months)")
-    st.write("**Observation:** CLTV gradually increases between 7 and 36 months as customers "
-             "adopt more services or bundled options.")
-
-    st.subheader("🏆 CLTV for Long-Term Customers (49–60 months)")
-    st.write("**Observation:** There is often a peak in the 49–60 month range, indicating that "
-             "long-term customers perceive more value and spend more.")
-
-    st.subheader("🔄 Stabilization or Slight Decline After 61+ Months")
-    st.write("**Observation:** Some older customers may stabilize or slightly reduce their spending—"
-             "they may no longer need additional services or could be exploring alternatives.")
+    st.markdown(INSIGHTS_CLTV_BY_TENURE)
 
 st.write('### 📌 What should be the strategy to reduce churn?')
 
 with st.expander("💡 Click to view detailed strategy suggestions"):
-
-    st.markdown("## **Overview of Recommendations**")
-
-    # Insights on churn by age group
-    st.subheader("📌 Insights on Churn by Age Group")
-    st.write("**Strategy:** Consider **special offer campaigns for seniors/families** or **long-term discounted bundles** to retain high-value customers.")
-
-    # Insights on churn by contract type
-    st.subheader("📌 Insights on Churn by Contract Type")
-    st.write("**Strategy:** Provide **effective onboarding experiences and initial incentives** for monthly contracts, promoting loyalty early on.")
-    st.write("**Strategy:** Encourage **cross-selling of additional services**, mid-contract upgrades, or loyalty rewards to increase customer value.")
-
-    # Key churn factors and strategies
-    st.markdown("### **Key Churn Factors and Strategies to Mitigate Them**")
-
-    # Churn due to competition
-    st.markdown("#### ✔️ **Competition**")
-    st.write("**Strategy:** Strengthen **loyalty programs** and offer **competitive bundles** to retain customers.")
-
-    # Churn due to dissatisfaction
-    st.markdown("#### 📉 **Dissatisfaction**")
-    st.write("**Strategy:** Improve **service quality, network coverage, and customer experience** to reduce churn caused by dissatisfaction.")
-
-    # Churn due to customer service
-    st.markdown("#### 🤝 **Customer Service**")
-    st.write("**Strategy:** Invest in **regional training for support teams** and **optimize customer service** processes.")
-
-    # Churn based on location
-    st.markdown("#### 🌍 **Location-Based Churn**")
-    st.write("**Strategy:** Implement **location-specific retention offers**, focusing on urban areas with higher churn rates.")
-
-    # Price concerns
-    st.markdown("#### 💰 **Price and Perceived Value**")
-    st.write("**Strategy:** Offer **tiered pricing plans** and **regional discounts** to improve affordability and retention.")
-
-    # Retaining high-value customers
-    st.markdown("#### 🏆 **Retaining High-Value & Long-Term Customers**")
-    st.write("**Strategy:** Provide **loyalty benefits, VIP support lines, or device upgrades** to reward and retain these valuable customers.")
-
-    # Final observations
-    st.subheader("🔍 Final Observations")
-    st.write("**Senior and middle-aged customers** are the most likely to cancel due to competitor offers and dissatisfaction with services. "
-             "Meanwhile, **younger customers** seek greater flexibility, often preferring short-term contracts.")
+    st.markdown(STRATEGY_SUGGESTIONS)
 
 st.write('---')